@@ -1,96 +1,56 @@
 """Project bootstrapping for Flutter setup."""
 
-import subprocess
+import asyncio
+import json
+import os
+import re
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Set, Tuple
 
 from rich.console import Console
 
-from .config import Config
+from .config import FLUTTER_ROOT, HOME, Config
 
 console = Console()
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC
 
-class ProjectBootstrap:
-    """Bootstraps development environment for Flutter projects."""
-
-    def __init__(self, config: Config):
-        """Initialize ProjectBootstrap."""
-        self.config = config
-        self.home = Path.home()
-        self.flutter_root = self.home / "development" / "flutter"
-
-    def bootstrap_project(self) -> None:
-        """Bootstrap the development environment."""
-        if self.config.dry_run:
-            console.print(
-                "[yellow]DRY RUN: Would bootstrap development environment[/yellow]"
-            )
-            return
-
-        console.print("  🔧 Bootstrapping development & testing helpers...")
-
-        # Create VS Code/Cursor configuration
-        self._create_vscode_config()
-
-        # Create Makefile
-        self._create_makefile()
-
-        # Create test structure
-        self._create_test_structure()
-
-        # Create analysis options
-        self._create_analysis_options()
-
-        # Create GitHub Actions CI
-        self._create_github_actions()
-
-        # Add dependencies
-        self._add_dependencies()
-
-        # Create environment support
-        self._create_environment_support()
 
-        # Create README
-        self._create_readme()
+def _discard(*args: Any, **kwargs: Any) -> None:
+    """Drop a status message."""
 
-        # Format code
-        self._format_code()
 
-    def _create_vscode_config(self) -> None:
-        """Create VS Code/Cursor configuration files."""
-        vscode_dir = self.config.project_path / ".vscode"
-        vscode_dir.mkdir(exist_ok=True)
+def _write_file(path: str, data: bytes) -> None:
+    """Write a small file with a single unbuffered write."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
-        # Settings
-        settings = {
-            "dart.flutterHotReloadOnSave": "all",
-            "dart.lineLength": 100,
-            "editor.formatOnSave": True,
-            "editor.defaultFormatter": "Dart-Code.dart-code",
-            "files.exclude": {"**/.dart_tool": True, "**/build": True},
-        }
-
-        import json
-
-        with open(vscode_dir / "settings.json", "w") as f:
-            json.dump(settings, f, indent=2)
-
-        # Launch configuration
-        launch_config = {
-            "version": "0.2.0",
-            "configurations": [
-                {"name": "Flutter Debug", "request": "launch", "type": "dart"}
-            ],
-        }
 
-        with open(vscode_dir / "launch.json", "w") as f:
-            json.dump(launch_config, f, indent=2)
+_VSCODE_SETTINGS = json.dumps(
+    {
+        "dart.flutterHotReloadOnSave": "all",
+        "dart.lineLength": 100,
+        "editor.formatOnSave": True,
+        "editor.defaultFormatter": "Dart-Code.dart-code",
+        "files.exclude": {"**/.dart_tool": True, "**/build": True},
+    },
+    indent=2,
+).encode()
 
-        console.print("  ✅ VS Code/Cursor configuration created")
+_VSCODE_LAUNCH = json.dumps(
+    {
+        "version": "0.2.0",
+        "configurations": [
+            {"name": "Flutter Debug", "request": "launch", "type": "dart"}
+        ],
+    },
+    indent=2,
+).encode()
 
-    def _create_makefile(self) -> None:
-        """Create Makefile with common commands."""
-        makefile_content = """run:
+_MAKEFILE = b"""run:
 	flutter run -d chrome
 
 run_ios:
@@ -109,90 +69,7 @@ integration:
 	flutter test integration_test
 """
 
-        with open(self.config.project_path / "Makefile", "w") as f:
-            f.write(makefile_content)
-
-        console.print("  ✅ Makefile created")
-
-    def _create_test_structure(self) -> None:
-        """Create test directory structure."""
-        test_dir = self.config.project_path / "test"
-        test_dir.mkdir(exist_ok=True)
-
-        # Unit test directory
-        unit_dir = test_dir / "unit"
-        unit_dir.mkdir(exist_ok=True)
-
-        # Widget test directory
-        widget_dir = test_dir / "widget"
-        widget_dir.mkdir(exist_ok=True)
-
-        # Integration test directory
-        integration_dir = self.config.project_path / "integration_test"
-        integration_dir.mkdir(exist_ok=True)
-
-        # Create sample tests
-        self._create_sample_tests()
-
-        console.print("  ✅ Test structure created")
-
-    def _create_sample_tests(self) -> None:
-        """Create sample test files."""
-        # Unit test
-        unit_test = """import 'package:flutter_test/flutter_test.dart';
-
-void main() {
-  test('sanity check', () {
-    expect(1 + 1, equals(2));
-  });
-}
-"""
-
-        with open(
-            self.config.project_path / "test" / "unit" / "sanity_test.dart", "w"
-        ) as f:
-            f.write(unit_test)
-
-        # Widget test
-        widget_test = f"""import 'package:flutter_test/flutter_test.dart';
-import 'package:{self.config.package_name}/main.dart';
-
-void main() {{
-  testWidgets('App loads without errors', (tester) async {{
-    await tester.pumpWidget(const MyApp());
-    expect(find.byType(MyApp), findsOneWidget);
-  }});
-}}
-"""
-
-        with open(
-            self.config.project_path / "test" / "widget" / "app_widget_test.dart", "w"
-        ) as f:
-            f.write(widget_test)
-
-        # Integration test
-        integration_test = f"""import 'package:integration_test/integration_test.dart';
-import 'package:flutter_test/flutter_test.dart';
-import 'package:{self.config.package_name}/main.dart';
-
-void main() {{
-  IntegrationTestWidgetsFlutterBinding.ensureInitialized();
-
-  testWidgets('home page renders', (tester) async {{
-    await tester.pumpWidget(const MyApp());
-    expect(find.byType(MyApp), findsOneWidget);
-  }});
-}}
-"""
-
-        with open(
-            self.config.project_path / "integration_test" / "app_test.dart", "w"
-        ) as f:
-            f.write(integration_test)
-
-    def _create_analysis_options(self) -> None:
-        """Create analysis options file."""
-        analysis_content = """include: package:flutter_lints/flutter.yaml
+_ANALYSIS_OPTIONS = b"""include: package:flutter_lints/flutter.yaml
 
 linter:
   rules:
@@ -200,17 +77,7 @@ linter:
     prefer_const_constructors: true
 """
 
-        with open(self.config.project_path / "analysis_options.yaml", "w") as f:
-            f.write(analysis_content)
-
-        console.print("  ✅ Analysis options created")
-
-    def _create_github_actions(self) -> None:
-        """Create GitHub Actions CI workflow."""
-        workflows_dir = self.config.project_path / ".github" / "workflows"
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-
-        ci_content = """name: Flutter CI
+_GITHUB_CI = b"""name: Flutter CI
 
 on:
   push:
@@ -230,109 +97,56 @@ jobs:
       - run: flutter test
 """
 
-        with open(workflows_dir / "flutter-ci.yml", "w") as f:
-            f.write(ci_content)
-
-        console.print("  ✅ GitHub Actions CI created")
-
-    def _add_dependencies(self) -> None:
-        """Add required dependencies to the project."""
-        try:
-            # Add flutter_dotenv
-            subprocess.run(
-                [
-                    str(self.flutter_root / "bin" / "flutter"),
-                    "pub",
-                    "add",
-                    "flutter_dotenv",
-                ],
-                cwd=self.config.project_path,
-                check=False,
-                capture_output=True,
-            )
-
-            # Add dev dependencies
-            subprocess.run(
-                [
-                    str(self.flutter_root / "bin" / "flutter"),
-                    "pub",
-                    "add",
-                    "--dev",
-                    "flutter_lints",
-                    "integration_test",
-                ],
-                cwd=self.config.project_path,
-                check=False,
-                capture_output=True,
-            )
-
-            console.print("  ✅ Dependencies added")
+_UNIT_TEST = b"""import 'package:flutter_test/flutter_test.dart';
 
-        except Exception as e:
-            console.print(f"  ⚠️  Dependency addition warning: {e}")
+void main() {
+  test('sanity check', () {
+    expect(1 + 1, equals(2));
+  });
+}
+"""
 
-    def _create_environment_support(self) -> None:
-        """Create environment variable support."""
-        # Create .env file
-        env_content = """# Example environment variables
+_ENV = b"""# Example environment variables
 API_URL=https://api.example.com
 """
 
-        with open(self.config.project_path / ".env", "w") as f:
-            f.write(env_content)
-
-        # Modify main.dart to load .env
-        self._modify_main_dart()
-
-        console.print("  ✅ Environment support created")
-
-    def _modify_main_dart(self) -> None:
-        """Modify main.dart to load environment variables."""
-        main_dart = self.config.project_path / "lib" / "main.dart"
-
-        if not main_dart.exists():
-            return
+# Static project files, keyed by path relative to the project root
+TEMPLATES: Dict[str, bytes] = {
+    ".vscode/settings.json": _VSCODE_SETTINGS,
+    ".vscode/launch.json": _VSCODE_LAUNCH,
+    "Makefile": _MAKEFILE,
+    "test/unit/sanity_test.dart": _UNIT_TEST,
+    "analysis_options.yaml": _ANALYSIS_OPTIONS,
+    ".github/workflows/flutter-ci.yml": _GITHUB_CI,
+    ".env": _ENV,
+}
 
-        try:
-            with open(main_dart, "r") as f:
-                content = f.read()
+_WIDGET_TEST = b"""import 'package:flutter_test/flutter_test.dart';
+import 'package:%(package_name)s/main.dart';
 
-            # Add import if not present
-            if "flutter_dotenv" not in content:
-                # Find first import line
-                lines = content.split("\n")
-                import_index = -1
-                for i, line in enumerate(lines):
-                    if line.strip().startswith("import ") and "package:flutter" in line:
-                        import_index = i
-                        break
-
-                if import_index >= 0:
-                    lines.insert(
-                        import_index + 1,
-                        "import 'package:flutter_dotenv/flutter_dotenv.dart';",
-                    )
-                else:
-                    lines.insert(
-                        0, "import 'package:flutter_dotenv/flutter_dotenv.dart';"
-                    )
+void main() {
+  testWidgets('App loads without errors', (tester) async {
+    await tester.pumpWidget(const MyApp());
+    expect(find.byType(MyApp), findsOneWidget);
+  });
+}
+"""
 
-                # Modify main function
-                modified_content = "\n".join(lines)
-                modified_content = modified_content.replace(
-                    "void main() {",
-                    'Future<void> main() async {\n  await dotenv.load(fileName: ".env");',
-                )
+_INTEGRATION_TEST = b"""import 'package:integration_test/integration_test.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:%(package_name)s/main.dart';
 
-                with open(main_dart, "w") as f:
-                    f.write(modified_content)
+void main() {
+  IntegrationTestWidgetsFlutterBinding.ensureInitialized();
 
-        except Exception as e:
-            console.print(f"  ⚠️  Main.dart modification warning: {e}")
+  testWidgets('home page renders', (tester) async {
+    await tester.pumpWidget(const MyApp());
+    expect(find.byType(MyApp), findsOneWidget);
+  });
+}
+"""
 
-    def _create_readme(self) -> None:
-        """Create README file."""
-        readme_content = f"""# {self.config.project_name}
+_README = b"""# %(project_name)s
 
 Flutter app scaffolded for Cursor.
 
@@ -357,20 +171,221 @@ make analyze
 Edit `.env` and access with `dotenv.env['KEY']` after startup.
 """
 
-        with open(self.config.project_path / "README.md", "w") as f:
-            f.write(readme_content)
+_DOTENV_IMPORT = b"import 'package:flutter_dotenv/flutter_dotenv.dart';"
+_DOTENV_IMPORT_SUB = b"\\g<0>\n" + _DOTENV_IMPORT
+_DOTENV_MAIN = b'Future<void> main() async {\n  await dotenv.load(fileName: ".env");'
+_FLUTTER_IMPORT_RE = re.compile(rb"^[ \t]*import [^\n]*package:flutter[^\n]*", re.M)
+_MAIN_RE = re.compile(rb"\bvoid\s+main\s*\(\s*\)\s*\{")
+
+# Project files rendered with %-formatting, keyed like TEMPLATES
+_PROJECT_TEMPLATES: Dict[str, bytes] = {
+    "test/widget/app_widget_test.dart": _WIDGET_TEST,
+    "integration_test/app_test.dart": _INTEGRATION_TEST,
+    "README.md": _README,
+}
 
-        console.print("  ✅ README created")
 
-    def _format_code(self) -> None:
-        """Format the generated code."""
+class ProjectBootstrap:
+    """Bootstraps development environment for Flutter projects."""
+
+    DRY_RUN_STEPS = "\n".join(
+        [
+            f"[yellow]DRY RUN: Would create {rel_path}[/yellow]"
+            for rel_path in [*TEMPLATES, *_PROJECT_TEMPLATES]
+        ]
+        + [
+            "[yellow]DRY RUN: Would add flutter_dotenv, flutter_lints and "
+            "integration_test[/yellow]",
+            "[yellow]DRY RUN: Would load .env from lib/main.dart[/yellow]",
+            "[yellow]DRY RUN: Would format code[/yellow]",
+        ]
+    )
+
+    home = HOME
+    flutter_root = FLUTTER_ROOT
+
+    def __init__(self, config: Config):
+        """Initialize ProjectBootstrap."""
+        self.config = config
+        self._planned_dirs: Set[Path] = set()
+        self._log: Callable[..., None] = console.print if config.verbose else _discard
+        self._warn = console.print
+        self._pp = self.config.project_path_str
+        self._flutter = str(self.flutter_root / "bin" / "flutter")
+        self._dart = str(self.flutter_root / "bin" / "dart")
+        self._dart_sdk = str(
+            self.flutter_root / "bin" / "cache" / "dart-sdk" / "bin" / "dart"
+        )
+        self._main_dart = os.path.join(self._pp, "lib", "main.dart")
+        # .dart_tool is gitignored by flutter create, so the stamp stays private
+        self._stamp = os.path.join(self._pp, ".dart_tool", "flutter_setup.stamp")
+
+    async def bootstrap_project(self) -> None:
+        """Bootstrap the development environment."""
+        if self.config.dry_run:
+            console.print(self.DRY_RUN_STEPS)
+            return
+
+        self._log("  🔧 Bootstrapping development & testing helpers...")
+
+        # File writes don't depend on pub, so run them while dependencies
+        # are being added
+        loop = asyncio.get_running_loop()
+        steps = [
+            self._add_dependencies(),
+            loop.run_in_executor(None, self._write_templates),
+        ]
+
+        # Skip main.dart entirely if it hasn't changed since we last patched it
+        if not self._main_dart_patched():
+            steps.append(loop.run_in_executor(None, self._modify_main_dart))
+
+        await asyncio.gather(*steps)
+
+        # Format code once dependencies and files are in place
+        await self._format_code()
+
+    def _write_templates(self) -> None:
+        """Write all static and rendered project files in a single pass."""
+        values = {
+            b"package_name": self.config.package_name.encode(),
+            b"project_name": self.config.project_name.encode(),
+        }
+        files = dict(TEMPLATES)
+        for rel_path, template in _PROJECT_TEMPLATES.items():
+            files[rel_path] = template % values
+
+        self._plan_dirs(files)
+        self._make_planned_dirs()
+
+        for rel_path, data in files.items():
+            _write_file(os.path.join(self._pp, rel_path), data)
+
+        self._log("  ✅ VS Code/Cursor configuration created")
+        self._log("  ✅ Makefile created")
+        self._log("  ✅ Test structure created")
+        self._log("  ✅ Analysis options created")
+        self._log("  ✅ GitHub Actions CI created")
+        self._log("  ✅ Environment support created")
+        self._log("  ✅ README created")
+
+    def _plan_dirs(self, rel_paths: Iterable[str]) -> None:
+        """Record every directory below the project root the files need."""
+        root = self.config.project_path
+        for rel_path in rel_paths:
+            parent = (root / rel_path).parent
+            while parent != root and parent not in self._planned_dirs:
+                self._planned_dirs.add(parent)
+                parent = parent.parent
+
+    def _make_planned_dirs(self) -> None:
+        """Create each planned directory exactly once, parents first."""
+        for directory in sorted(self._planned_dirs, key=lambda p: len(p.parts)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+
+    async def _run(self, *args: str) -> Tuple[int, str]:
+        """Run a command in the project directory.
+
+        Stdout is discarded; stderr is kept so failures can be reported.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=self._pp,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        returncode = await proc.wait()
+        return returncode, stderr.decode(errors="replace").strip()
+
+    async def _add_dependencies(self) -> None:
+        """Add required dependencies to the project."""
         try:
-            subprocess.run(
-                [str(self.flutter_root / "bin" / "dart"), "format", "."],
-                cwd=self.config.project_path,
-                check=False,
-                capture_output=True,
+            # Add runtime and dev dependencies in one pub invocation
+            returncode, stderr = await self._run(
+                self._flutter,
+                "pub",
+                "add",
+                "flutter_dotenv",
+                "dev:flutter_lints",
+                "dev:integration_test",
             )
-            console.print("  ✅ Code formatted")
+
+            # Older Flutter releases don't understand the dev: prefix
+            if returncode != 0:
+                returncode, stderr = await self._run(
+                    self._flutter, "pub", "add", "flutter_dotenv"
+                )
+                if returncode == 0:
+                    returncode, stderr = await self._run(
+                        self._flutter,
+                        "pub",
+                        "add",
+                        "--dev",
+                        "flutter_lints",
+                        "integration_test",
+                    )
+
+            if returncode == 0:
+                self._log("  ✅ Dependencies added")
+            else:
+                self._warn(f"  ⚠️  Dependency addition warning: {stderr}")
+
+        except Exception as e:
+            self._warn(f"  ⚠️  Dependency addition warning: {e}")
+
+    def _main_dart_patched(self) -> bool:
+        """Check whether main.dart is unchanged since it was last patched."""
+        try:
+            stamp_mtime = os.stat(self._stamp).st_mtime
+            return stamp_mtime >= os.stat(self._main_dart).st_mtime
+        except FileNotFoundError:
+            return False
+
+    def _modify_main_dart(self) -> None:
+        """Modify main.dart to load environment variables."""
+        main_dart = Path(self._main_dart)
+
+        try:
+            content = main_dart.read_bytes()
+
+            # Add import if not present
+            if b"flutter_dotenv" not in content:
+                # Insert after the first flutter import, or at the top
+                content, count = _FLUTTER_IMPORT_RE.subn(
+                    _DOTENV_IMPORT_SUB, content, count=1
+                )
+                if count == 0:
+                    content = _DOTENV_IMPORT + b"\n" + content
+
+                # Modify main function
+                content = _MAIN_RE.sub(_DOTENV_MAIN, content, count=1)
+
+                _write_file(self._main_dart, content)
+
+            # Record the patch so re-runs can skip reading main.dart
+            os.makedirs(os.path.dirname(self._stamp), exist_ok=True)
+            Path(self._stamp).touch()
+
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self._warn(f"  ⚠️  Main.dart modification warning: {e}")
+
+    async def _format_code(self) -> None:
+        """Format the generated code."""
+        try:
+            # The cached SDK binary skips the bin/dart wrapper's update check;
+            # it only exists once the Flutter tool has run at least once
+            dart = self._dart_sdk if os.path.exists(self._dart_sdk) else self._dart
+            returncode, stderr = await self._run(dart, "format", ".")
+            if returncode == 0:
+                self._log("  ✅ Code formatted")
+            else:
+                self._warn(f"  ⚠️  Code formatting warning: {stderr}")
         except Exception as e:
-            console.print(f"  ⚠️  Code formatting warning: {e}")
+            self._warn(f"  ⚠️  Code formatting warning: {e}")
@@ -80,6 +80,22 @@ def print_banner() -> None:
     is_flag=True,
     help="Preview actions without executing them",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Ignore cached tool checks from previous runs",
+)
+@click.option(
+    "--partial-clone/--no-partial-clone",
+    default=True,
+    help="Clone Flutter without file contents until needed (default: on)",
+)
+@click.option(
+    "--fetch-ttl",
+    type=click.IntRange(min=0),
+    default=3600,
+    help="Seconds before Flutter is fetched from origin again (default: 3600)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -97,6 +113,9 @@ def main(
     android_language: AndroidLanguage,
     flutter_update: UpdateMode,
     dry_run: bool,
+    refresh: bool,
+    partial_clone: bool,
+    fetch_ttl: int,
     verbose: bool,
 ) -> None:
     """Set up a complete Flutter development environment."""
@@ -121,6 +140,9 @@ def main(
             flutter_update_mode=flutter_update,
             dry_run=dry_run,
             verbose=verbose,
+            refresh=refresh,
+            partial_clone=partial_clone,
+            fetch_ttl_seconds=fetch_ttl,
         )
 
         # Create and run setup
@@ -1,8 +1,10 @@
 """Configuration and data models for Flutter Setup."""
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Literal
+from typing import List, Literal, get_args
 
 # Type aliases
 FlutterChannel = Literal["stable", "beta"]
@@ -12,8 +14,20 @@ AndroidLanguage = Literal["kotlin", "java"]
 UpdateMode = Literal["reset", "reclone", "skip"]
 Platform = Literal["ios", "android", "macos", "linux", "windows", "web"]
 
+# Resolved once per process; the managers share these
+HOME: Path = Path.home()
+FLUTTER_ROOT: Path = HOME / "development" / "flutter"
 
-@dataclass
+_INVALID_PKG_CHARS = re.compile(r"[^a-z0-9_]+")
+_VALID_PLATFORMS = frozenset(get_args(Platform))
+_VALID_CHANNELS = frozenset(get_args(FlutterChannel))
+_VALID_TEMPLATES = frozenset(get_args(TemplateType))
+_VALID_IOS_LANGUAGES = frozenset(get_args(IosLanguage))
+_VALID_ANDROID_LANGUAGES = frozenset(get_args(AndroidLanguage))
+_VALID_UPDATE_MODES = frozenset(get_args(UpdateMode))
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration for Flutter setup."""
 
@@ -28,10 +42,21 @@ class Config:
     flutter_update_mode: UpdateMode
     dry_run: bool
     verbose: bool
+    refresh: bool = False
+    partial_clone: bool = True
+    fetch_ttl_seconds: int = 3600
+    _project_path: Path = field(init=False, repr=False, compare=False)
+    _project_path_str: str = field(init=False, repr=False, compare=False)
+    _package_name: str = field(init=False, repr=False, compare=False)
+    _platforms_csv: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         self._validate()
+        self._project_path = self.output_dir / self.project_name
+        self._project_path_str = os.fspath(self._project_path)
+        self._package_name = self._sanitize_package_name(self.project_name)
+        self._platforms_csv = ",".join(self.platforms)
 
     def _validate(self) -> None:
         """Validate configuration values."""
@@ -42,39 +67,55 @@ class Config:
             raise ValueError("At least one platform must be specified")
 
         # Validate platforms
-        valid_platforms = {"ios", "android", "macos", "linux", "windows", "web"}
-        for platform in self.platforms:
-            if platform.lower() not in valid_platforms:
-                raise ValueError(f"Invalid platform: {platform}")
+        lowered = [platform.lower() for platform in self.platforms]
+        invalid = set(lowered) - _VALID_PLATFORMS
+        if invalid:
+            platform = next(p for p in self.platforms if p.lower() in invalid)
+            raise ValueError(f"Invalid platform: {platform}")
+
+        # Normalize so downstream checks and platforms_csv see lowercase names
+        self.platforms = list(dict.fromkeys(lowered))
+
+        if self.channel not in _VALID_CHANNELS:
+            raise ValueError(f"Invalid channel: {self.channel}")
+
+        if self.template not in _VALID_TEMPLATES:
+            raise ValueError(f"Invalid template: {self.template}")
+
+        if self.flutter_update_mode not in _VALID_UPDATE_MODES:
+            raise ValueError(f"Invalid update mode: {self.flutter_update_mode}")
 
         # Validate template-specific options
         if self.template == "plugin":
-            if self.ios_language not in ["swift", "objc"]:
+            if self.ios_language not in _VALID_IOS_LANGUAGES:
                 raise ValueError(f"Invalid iOS language: {self.ios_language}")
-            if self.android_language not in ["kotlin", "java"]:
+            if self.android_language not in _VALID_ANDROID_LANGUAGES:
                 raise ValueError(f"Invalid Android language: {self.android_language}")
 
     @property
     def project_path(self) -> Path:
         """Get the full project path."""
-        return self.output_dir / self.project_name
+        return self._project_path
+
+    @property
+    def project_path_str(self) -> str:
+        """Get the full project path as a string."""
+        return self._project_path_str
 
     @property
     def package_name(self) -> str:
         """Get the sanitized package name."""
-        return self._sanitize_package_name(self.project_name)
+        return self._package_name
 
     @property
     def platforms_csv(self) -> str:
         """Get platforms as comma-separated string."""
-        return ",".join(self.platforms)
+        return self._platforms_csv
 
     def _sanitize_package_name(self, name: str) -> str:
         """Sanitize package name for Flutter."""
-        import re
-
-        # Convert to lowercase and replace non-alphanumeric with underscores
-        sanitized = re.sub(r"[^a-z0-9_]", "_", name.lower())
+        # Lowercase and replace each run of invalid characters with an underscore
+        sanitized = _INVALID_PKG_CHARS.sub("_", name.lower())
 
         # Ensure it starts with a letter
         if sanitized and not sanitized[0].isalpha():
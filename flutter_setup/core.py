@@ -1,5 +1,7 @@
 """Core Flutter setup functionality."""
 
+import asyncio
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
@@ -19,12 +21,48 @@ from .bootstrap import ProjectBootstrap
 console = Console()
 
 
+class _DryRunStub:
+    """Stands in for a setup step during dry runs and only reports intent."""
+
+    def __init__(self, header: str, intent: str):
+        """Initialize _DryRunStub."""
+        self.header = header
+        self.intent = intent
+
+    def describe(self) -> str:
+        """Describe what the step would do."""
+        return f"\n[bold]{self.header}[/bold]\n{self.intent}"
+
+
 class FlutterSetup:
     """Main class for orchestrating Flutter development environment setup."""
 
     def __init__(self, config: Config):
         """Initialize FlutterSetup with configuration."""
         self.config = config
+
+        # Previews never touch the managers, so don't pay for their setup
+        if config.dry_run:
+            self._dry_run_steps = (
+                _DryRunStub(
+                    "📋 Checking prerequisites...",
+                    "[yellow]DRY RUN: Would check and install prerequisites[/yellow]",
+                ),
+                _DryRunStub(
+                    "🦋 Installing/updating Flutter SDK...",
+                    "[yellow]DRY RUN: Would manage Flutter SDK[/yellow]",
+                ),
+                _DryRunStub(
+                    "🏗️  Creating Flutter project...",
+                    "[yellow]DRY RUN: Would create Flutter project[/yellow]",
+                ),
+                _DryRunStub(
+                    "🔧 Bootstrapping development environment...",
+                    ProjectBootstrap.DRY_RUN_STEPS,
+                ),
+            )
+            return
+
         self.prerequisites = PrerequisitesManager(config)
         self.flutter_manager = FlutterManager(config)
         self.project_creator = ProjectCreator(config)
@@ -35,31 +73,44 @@ class FlutterSetup:
         console.print(
             f"\n[bold blue]🚀 Starting Flutter setup for: {self.config.project_name}[/bold blue]"
         )
-        console.print(
-            f"[dim]Template: {self.config.template} | Org: {self.config.org} | Channel: {self.config.channel}[/dim]"
-        )
-        console.print(
-            f"[dim]Platforms: {', '.join(self.config.platforms)} | Package: {self.config.package_name}[/dim]"
-        )
-        console.print(f"[dim]Output: {self.config.project_path}[/dim]")
+        if self.config.verbose:
+            console.print(
+                f"[dim]Template: {self.config.template} | Org: {self.config.org} | Channel: {self.config.channel}[/dim]"
+            )
+            console.print(
+                f"[dim]Platforms: {', '.join(self.config.platforms)} | Package: {self.config.package_name}[/dim]"
+            )
+            console.print(f"[dim]Output: {self.config.project_path}[/dim]")
 
         if self.config.dry_run:
             console.print(
                 "[yellow]⚠️  DRY RUN MODE - No actual changes will be made[/yellow]"
             )
+            console.print("\n".join(step.describe() for step in self._dry_run_steps))
+            self._show_next_steps()
+            return
 
         try:
-            # Step 1: Check and install prerequisites
-            self._run_prerequisites()
+            # Fetch Flutter updates while the prerequisites are checked
+            self.flutter_manager.start_prefetch()
 
-            # Step 2: Install/update Flutter SDK
-            self._run_flutter_installation()
+            # One live display for all steps, each step adds its own row
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                # Step 1: Check and install prerequisites
+                self._run_prerequisites(progress)
 
-            # Step 3: Create Flutter project
-            self._run_project_creation()
+                # Step 2: Install/update Flutter SDK
+                self._run_flutter_installation(progress)
 
-            # Step 4: Bootstrap development environment
-            self._run_bootstrap()
+                # Step 3: Create Flutter project
+                self._run_project_creation(progress)
+
+                # Step 4: Bootstrap development environment
+                self._run_bootstrap(progress)
 
             # Step 5: Display next steps
             self._show_next_steps()
@@ -67,78 +118,72 @@ class FlutterSetup:
         except Exception as e:
             console.print(f"\n[red]❌ Setup failed: {e}[/red]")
             raise
+        finally:
+            # Don't leave a background fetch running after a failed step
+            self.flutter_manager.stop_prefetch()
 
-    def _run_prerequisites(self) -> None:
+    def _run_prerequisites(self, progress: Progress) -> None:
         """Run prerequisites check and installation."""
         console.print("\n[bold]📋 Checking prerequisites...[/bold]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Checking system requirements...", total=None)
-
-            try:
-                self.prerequisites.check_and_install()
-                progress.update(task, description="✅ Prerequisites satisfied")
-            except Exception as e:
-                progress.update(task, description="❌ Prerequisites failed")
-                raise PrerequisitesError(f"Failed to install prerequisites: {e}")
-
-    def _run_flutter_installation(self) -> None:
+        task = progress.add_task("Checking system requirements...", total=None)
+
+        try:
+            self.prerequisites.check_and_install()
+            progress.update(
+                task, description="✅ Prerequisites satisfied", total=1, completed=1
+            )
+        except Exception as e:
+            progress.update(task, description="❌ Prerequisites failed")
+            raise PrerequisitesError(f"Failed to install prerequisites: {e}")
+
+    def _run_flutter_installation(self, progress: Progress) -> None:
         """Run Flutter SDK installation/update."""
         console.print("\n[bold]🦋 Installing/updating Flutter SDK...[/bold]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Setting up Flutter SDK...", total=None)
-
-            try:
-                self.flutter_manager.ensure_flutter()
-                progress.update(task, description="✅ Flutter SDK ready")
-            except Exception as e:
-                progress.update(task, description="❌ Flutter installation failed")
-                raise FlutterInstallationError(f"Failed to install Flutter: {e}")
-
-    def _run_project_creation(self) -> None:
+        task = progress.add_task("Setting up Flutter SDK...", total=None)
+
+        try:
+            self.flutter_manager.ensure_flutter()
+            progress.update(
+                task, description="✅ Flutter SDK ready", total=1, completed=1
+            )
+        except Exception as e:
+            progress.update(task, description="❌ Flutter installation failed")
+            raise FlutterInstallationError(f"Failed to install Flutter: {e}")
+
+    def _run_project_creation(self, progress: Progress) -> None:
         """Run Flutter project creation."""
         console.print("\n[bold]🏗️  Creating Flutter project...[/bold]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Creating project structure...", total=None)
-
-            try:
-                self.project_creator.create_project()
-                progress.update(task, description="✅ Project created")
-            except Exception as e:
-                progress.update(task, description="❌ Project creation failed")
-                raise ProjectCreationError(f"Failed to create project: {e}")
-
-    def _run_bootstrap(self) -> None:
+        task = progress.add_task("Creating project structure...", total=None)
+
+        try:
+            self.project_creator.create_project()
+            progress.update(
+                task, description="✅ Project created", total=1, completed=1
+            )
+        except Exception as e:
+            progress.update(task, description="❌ Project creation failed")
+            raise ProjectCreationError(f"Failed to create project: {e}")
+
+    def _run_bootstrap(self, progress: Progress) -> None:
         """Run project bootstrapping."""
         console.print("\n[bold]🔧 Bootstrapping development environment...[/bold]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Setting up development tools...", total=None)
-
-            try:
-                self.bootstrap.bootstrap_project()
-                progress.update(task, description="✅ Development environment ready")
-            except Exception as e:
-                progress.update(task, description="❌ Bootstrap failed")
-                raise FlutterSetupError(f"Failed to bootstrap project: {e}")
+        task = progress.add_task("Setting up development tools...", total=None)
+
+        try:
+            asyncio.run(self.bootstrap.bootstrap_project())
+            progress.update(
+                task,
+                description="✅ Development environment ready",
+                total=1,
+                completed=1,
+            )
+        except Exception as e:
+            progress.update(task, description="❌ Bootstrap failed")
+            raise FlutterSetupError(f"Failed to bootstrap project: {e}")
 
     def _show_next_steps(self) -> None:
         """Display next steps for the user."""
@@ -1,26 +1,93 @@
 """Flutter SDK management for Flutter setup."""
 
+import hashlib
+import http.client
+import json
+import os
+import platform
+import shlex
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import time
+import urllib.request
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 
-from .config import Config
+from .config import FLUTTER_ROOT, HOME, Config
 from .exceptions import FlutterInstallationError
+from .probe_cache import ProbeCache
+from .process import run, tool
 
 console = Console()
 
+_RELEASES_URL = (
+    "https://storage.googleapis.com/flutter_infra_release/releases/releases_{}.json"
+)
+_ARCHIVE_CHANNELS = frozenset({"stable", "beta"})
+_FLUTTER_REPO = "https://github.com/flutter/flutter.git"
+_FETCH = "{} -c protocol.version=2 fetch origin --prune"
+# Exit status the update chain uses when only the fast-forward failed
+_FF_FAILED = 99
+
 
 class FlutterManager:
     """Manages Flutter SDK installation and updates."""
 
+    home = HOME
+    flutter_root = FLUTTER_ROOT
+    zprofile = HOME / ".zprofile"
+
     def __init__(self, config: Config):
         """Initialize FlutterManager."""
         self.config = config
-        self.home = Path.home()
-        self.flutter_root = self.home / "development" / "flutter"
-        self.zprofile = self.home / ".zprofile"
+        self._probes = ProbeCache()
+        if config.refresh:
+            self._probes.clear()
+        self._prefetch: "Optional[subprocess.Popen[bytes]]" = None
+
+    def start_prefetch(self) -> None:
+        """Start fetching an existing Flutter checkout in the background.
+
+        The network wait then overlaps with the prerequisite checks, and
+        _update_flutter only has to check out and merge.
+        """
+        if (
+            self.config.dry_run
+            or self.config.flutter_update_mode == "reclone"
+            or not self._has_checkout()
+            or not self._fetch_due()
+        ):
+            return
+
+        git = shlex.quote(tool("git"))
+        steps = [*self._set_url_steps(git), _FETCH.format(git)]
+
+        # Its own session lets stop_prefetch signal git as well as the shell;
+        # a failed prefetch is retried, and reported, by _update_flutter
+        self._prefetch = subprocess.Popen(
+            [tool("bash"), "-c", " && ".join(steps)],
+            cwd=self.flutter_root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def stop_prefetch(self) -> None:
+        """Stop a background fetch that is still running."""
+        if self._prefetch is None or self._prefetch.poll() is not None:
+            return
+
+        try:
+            os.killpg(self._prefetch.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        self._prefetch.wait()
 
     def ensure_flutter(self) -> None:
         """Ensure Flutter SDK is installed and up to date."""
@@ -34,7 +101,7 @@ class FlutterManager:
             return
 
         # Check if Flutter is already installed
-        if not self.flutter_root.exists() or not (self.flutter_root / ".git").exists():
+        if not self._has_checkout():
             self._install_flutter()
         else:
             self._update_flutter()
@@ -42,23 +109,47 @@ class FlutterManager:
         # Ensure Flutter is in PATH
         self._ensure_flutter_path()
 
-        # Run flutter doctor
-        self._run_flutter_doctor()
+        # Download engine artifacts for the selected platforms
+        self._precache_artifacts()
+
+        # The full doctor report re-probes tools prerequisites already checked
+        if self.config.verbose:
+            self._run_flutter_doctor()
+
+    def _has_checkout(self) -> bool:
+        """Check whether the Flutter root holds a git checkout.
+
+        HEAD is checked rather than .git so a .git directory left half
+        removed by an interrupted reclone doesn't count.
+        """
+        return (self.flutter_root / ".git" / "HEAD").is_file()
 
     def _reclone_flutter(self) -> None:
         """Reclone Flutter repository."""
         console.print(f"  🔄 Recloning Flutter ({self.config.channel})...")
 
-        try:
-            if self.flutter_root.exists():
-                import shutil
+        # Keep the old checkout until the new one is installed, so a failed
+        # reclone doesn't leave the user without an SDK
+        old_root = self.flutter_root.with_suffix(".old")
+        backup = None
 
+        try:
+            if self._has_checkout():
+                shutil.rmtree(old_root, ignore_errors=True)
+                self.flutter_root.rename(old_root)
+                backup = old_root
+            elif self.flutter_root.exists():
                 shutil.rmtree(self.flutter_root)
 
             self._install_flutter()
         except Exception as e:
+            if backup is not None and not self.flutter_root.exists():
+                backup.rename(self.flutter_root)
             raise FlutterInstallationError(f"Failed to reclone Flutter: {e}")
 
+        if backup is not None:
+            shutil.rmtree(backup, ignore_errors=True)
+
     def _install_flutter(self) -> None:
         """Install Flutter SDK."""
         console.print(f"  📥 Installing Flutter ({self.config.channel})...")
@@ -67,16 +158,30 @@ class FlutterManager:
             # Create parent directory
             self.flutter_root.parent.mkdir(parents=True, exist_ok=True)
 
-            # Clone Flutter repository
-            subprocess.run(
+            # Prefer the prebuilt release archive for official channels
+            if self._download_sdk_archive(self.config.channel):
+                console.print("  ✅ Flutter installed")
+                return
+
+            # Clone Flutter repository; a partial clone fetches blobs lazily
+            # and git marks origin as the promisor remote for us
+            clone_opts = (
+                ["--filter=blob:none", "--single-branch"]
+                if self.config.partial_clone
+                else []
+            )
+            run(
                 [
                     "git",
+                    "-c",
+                    "protocol.version=2",
                     "clone",
+                    *clone_opts,
                     "--depth",
                     "1",
                     "-b",
                     self.config.channel,
-                    "https://github.com/flutter/flutter.git",
+                    _FLUTTER_REPO,
                     str(self.flutter_root),
                 ],
                 check=True,
@@ -88,74 +193,167 @@ class FlutterManager:
         except subprocess.CalledProcessError as e:
             raise FlutterInstallationError(f"Failed to install Flutter: {e}")
 
+    def _download_sdk_archive(self, channel: str) -> bool:
+        """Download and extract the latest release archive for a channel.
+
+        Returns False when no archive is available so the caller can fall
+        back to cloning the repository. Existing directories are left alone.
+        """
+        if channel not in _ARCHIVE_CHANNELS or self.flutter_root.exists():
+            return False
+
+        found = self._find_sdk_archive(channel)
+        if found is None:
+            return False
+        archive, sha256 = found
+
+        console.print(f"  📦 Downloading {archive.rsplit('/', 1)[-1]}...")
+
+        staging = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=Path(archive).suffix) as tmp:
+                digest = hashlib.sha256()
+                with urllib.request.urlopen(archive, timeout=60) as response:
+                    for chunk in iter(lambda: response.read(1 << 20), b""):
+                        digest.update(chunk)
+                        tmp.write(chunk)
+                tmp.flush()
+
+                if digest.hexdigest() != sha256:
+                    raise ValueError(f"checksum mismatch for {archive}")
+
+                # Extract next to the SDK and move it into place once complete,
+                # so an interrupted extraction never looks like an install
+                staging = tempfile.mkdtemp(dir=self.flutter_root.parent)
+
+                # unzip/tar keep the executable bits and symlinks the SDK needs
+                if archive.endswith(".zip"):
+                    extract = ["unzip", "-q", tmp.name, "-d"]
+                else:
+                    extract = ["tar", "-xf", tmp.name, "-C"]
+                run(extract + [staging], check=True, capture_output=True)
+
+            os.rename(os.path.join(staging, "flutter"), self.flutter_root)
+            return True
+
+        except (
+            OSError,
+            ValueError,
+            http.client.HTTPException,
+            subprocess.CalledProcessError,
+        ) as e:
+            console.print(f"  ⚠️  Archive install failed, cloning instead: {e}")
+            return False
+
+        finally:
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def _find_sdk_archive(self, channel: str) -> Optional[Tuple[str, str]]:
+        """Look up the current release for a channel.
+
+        Returns the archive's download URL and its SHA-256 checksum.
+        """
+        if sys.platform == "darwin":
+            host_os = "macos"
+        elif sys.platform.startswith("linux"):
+            host_os = "linux"
+        else:
+            return None
+
+        arch = "arm64" if platform.machine() in ("arm64", "aarch64") else "x64"
+
+        try:
+            with urllib.request.urlopen(
+                _RELEASES_URL.format(host_os), timeout=30
+            ) as response:
+                releases = json.load(response)
+
+            current = releases["current_release"][channel]
+            for release in releases["releases"]:
+                if (
+                    release["hash"] == current
+                    and release["channel"] == channel
+                    and release.get("dart_sdk_arch", "x64") == arch
+                ):
+                    url = f"{releases['base_url']}/{release['archive']}"
+                    return url, release["sha256"]
+
+        except (OSError, http.client.HTTPException, ValueError, KeyError) as e:
+            console.print(f"  ⚠️  Could not fetch Flutter releases: {e}")
+
+        return None
+
     def _update_flutter(self) -> None:
         """Update existing Flutter installation."""
         console.print(f"  🔄 Updating Flutter ({self.config.channel})...")
 
-        try:
-            # Set remote URL
-            subprocess.run(
-                [
-                    "git",
-                    "remote",
-                    "set-url",
-                    "origin",
-                    "https://github.com/flutter/flutter.git",
-                ],
-                cwd=self.flutter_root,
-                check=False,
-                capture_output=True,
-            )
+        git = shlex.quote(tool("git"))
+        channel = shlex.quote(self.config.channel)
+        upstream = shlex.quote(f"origin/{self.config.channel}")
 
-            # Fetch latest changes
-            subprocess.run(
-                ["git", "fetch", "origin", "--prune"],
-                cwd=self.flutter_root,
-                check=True,
-                capture_output=True,
-            )
+        # Wait for the background fetch, and only fetch here if it failed
+        steps: List[str] = []
+        if self._prefetch is None or self._prefetch.wait() != 0:
+            steps = self._set_url_steps(git)
+            if self._fetch_due():
+                steps.append(_FETCH.format(git))
+            else:
+                minutes = self._fetch_age() // 60
+                console.print(f"  ⏭️  Skipping fetch, last fetched {minutes:.0f}m ago")
+
+        # Check out the channel (creating it if needed) and fast-forward in
+        # the same shell so git's startup cost is paid once. A failed merge
+        # gets its own exit status, since git's messages may be localized
+        steps += [
+            f"({git} checkout {channel} || {git} checkout -b {channel} {upstream})",
+            f"({git} merge --ff-only {upstream} || exit {_FF_FAILED})",
+        ]
+
+        result = run(
+            ["bash", "-c", " && ".join(steps)],
+            cwd=self.flutter_root,
+            capture_output=True,
+            check=False,
+        )
 
-            # Try to checkout the target channel
-            try:
-                subprocess.run(
-                    ["git", "checkout", self.config.channel],
-                    cwd=self.flutter_root,
-                    check=True,
-                    capture_output=True,
-                )
-            except subprocess.CalledProcessError:
-                # Create new branch if it doesn't exist
-                subprocess.run(
-                    [
-                        "git",
-                        "checkout",
-                        "-b",
-                        self.config.channel,
-                        f"origin/{self.config.channel}",
-                    ],
-                    cwd=self.flutter_root,
-                    check=True,
-                    capture_output=True,
-                )
+        if result.returncode == 0:
+            remote_key = self._remote_key()
+            if remote_key is not None:
+                self._probes.set(remote_key, 0)
+            console.print("  ✅ Flutter updated (fast-forward)")
+            return
 
-            # Try fast-forward merge
-            try:
-                subprocess.run(
-                    ["git", "merge", "--ff-only", f"origin/{self.config.channel}"],
-                    cwd=self.flutter_root,
-                    check=True,
-                    capture_output=True,
-                )
-                console.print("  ✅ Flutter updated (fast-forward)")
-                return
-            except subprocess.CalledProcessError:
-                pass
+        if result.returncode != _FF_FAILED:
+            stderr = result.stderr.decode(errors="replace").strip()
+            raise FlutterInstallationError(f"Failed to update Flutter: {stderr}")
 
-            # Handle diverged branches
-            self._handle_diverged_branches()
+        # Handle diverged branches
+        self._handle_diverged_branches()
 
-        except subprocess.CalledProcessError as e:
-            raise FlutterInstallationError(f"Failed to update Flutter: {e}")
+    def _set_url_steps(self, git: str) -> List[str]:
+        """Build the shell step that points origin at Flutter, if needed."""
+        # Set remote URL, unless we already did so recently
+        remote_key = self._remote_key()
+        if remote_key is None or self._probes.get(remote_key) is None:
+            return [f"{git} remote set-url origin {shlex.quote(_FLUTTER_REPO)}"]
+        return []
+
+    def _remote_key(self) -> Optional[str]:
+        """Get the probe cache key recording that origin's URL was set."""
+        return ProbeCache.tool_key("git", "remote-set-url", str(self.flutter_root))
+
+    def _fetch_age(self) -> float:
+        """Get the seconds since origin was last fetched, or inf if never."""
+        try:
+            fetched = os.stat(self.flutter_root / ".git" / "FETCH_HEAD").st_mtime
+        except OSError:
+            return float("inf")
+        return time.time() - fetched
+
+    def _fetch_due(self) -> bool:
+        """Check whether origin should be fetched, honouring the fetch TTL."""
+        return self.config.refresh or self._fetch_age() >= self.config.fetch_ttl_seconds
 
     def _handle_diverged_branches(self) -> None:
         """Handle diverged Git branches."""
@@ -169,7 +367,7 @@ class FlutterManager:
 
         # Get commit counts
         try:
-            result = subprocess.run(
+            result = run(
                 [
                     "git",
                     "rev-list",
@@ -198,7 +396,7 @@ class FlutterManager:
         if self.config.flutter_update_mode == "reset":
             console.print("  🔄 Resetting Flutter to origin (discarding local changes)")
             try:
-                subprocess.run(
+                run(
                     ["git", "reset", "--hard", f"origin/{self.config.channel}"],
                     cwd=self.flutter_root,
                     check=True,
@@ -214,49 +412,88 @@ class FlutterManager:
 
         flutter_path = f'export PATH="{self.flutter_root}/bin:$PATH"'
 
-        # Add to .zprofile if not already there
-        if self.zprofile.exists():
-            with open(self.zprofile, "r") as f:
-                content = f.read()
-                if flutter_path not in content:
-                    with open(self.zprofile, "a") as f:
-                        f.write(f"\n{flutter_path}\n")
-                    console.print("  ✅ Flutter PATH added to .zprofile")
-                else:
-                    console.print("  ✅ Flutter PATH already in .zprofile")
-        else:
-            with open(self.zprofile, "w") as f:
-                f.write(f"{flutter_path}\n")
-            console.print("  ✅ Flutter PATH added to .zprofile")
+        # Add to .zprofile if not already there; a+ creates it if missing
+        with open(self.zprofile, "a+") as f:
+            f.seek(0)
+            if any(flutter_path in line for line in f):
+                console.print("  ✅ Flutter PATH already in .zprofile")
+            else:
+                # Appends always go to the end in a+ mode
+                f.write(f"\n{flutter_path}\n" if f.tell() else f"{flutter_path}\n")
+                console.print("  ✅ Flutter PATH added to .zprofile")
+
+        # Add to current environment so child processes can find flutter
+        flutter_bin = str(self.flutter_root / "bin")
+        path = os.environ.get("PATH", "")
+        if flutter_bin not in path.split(os.pathsep):
+            os.environ["PATH"] = f"{flutter_bin}{os.pathsep}{path}"
+
+    def _precache_artifacts(self) -> None:
+        """Download the Flutter artifacts needed for the selected platforms."""
+        console.print("  📦 Downloading Flutter artifacts...")
+
+        platform_flags = [
+            f"--{p}"
+            for p in ("android", "ios", "web", "macos", "linux", "windows")
+            if p in self.config.platforms
+        ]
 
-        # Add to current environment
-        flutter_bin = self.flutter_root / "bin"
-        if str(flutter_bin) not in sys.path:
-            sys.path.insert(0, str(flutter_bin))
+        try:
+            result = run(
+                [
+                    str(self.flutter_root / "bin" / "flutter"),
+                    "precache",
+                    "--universal",
+                    *platform_flags,
+                ],
+                capture_output=True,
+                check=False,
+            )
+
+            if result.returncode == 0:
+                console.print("  ✅ Flutter artifacts ready")
+            else:
+                console.print("  ⚠️  Flutter precache found issues:")
+                console.print(result.stderr.decode(errors="replace"))
+
+        except Exception as e:
+            console.print(f"  ⚠️  Flutter precache warning: {e}")
 
     def _run_flutter_doctor(self) -> None:
-        """Run flutter doctor to check setup."""
+        """Run flutter doctor to check setup, echoing its report.
+
+        Only called in verbose mode.
+        """
         console.print("  🏥 Running Flutter doctor...")
 
         try:
-            # Run flutter doctor
-            result = subprocess.run(
-                [str(self.flutter_root / "bin" / "flutter"), "doctor", "-v"],
-                capture_output=True,
+            # Stream the report as it's produced; it is written to stdout
+            proc = subprocess.Popen(
+                [str(self.flutter_root / "bin" / "flutter"), "doctor"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=False,
+                bufsize=1,
             )
 
-            if result.returncode == 0:
+            licenses_needed = False
+            assert proc.stdout is not None
+            with proc.stdout:
+                for line in proc.stdout:
+                    if "Some Android licenses not accepted" in line:
+                        licenses_needed = True
+                    console.print(line, end="", markup=False, highlight=False)
+
+            if proc.wait() == 0:
                 console.print("  ✅ Flutter doctor passed")
             else:
-                console.print("  ⚠️  Flutter doctor found issues:")
-                console.print(result.stderr)
+                console.print("  ⚠️  Flutter doctor found issues")
 
-                # Check for Android licenses
-                if "Some Android licenses not accepted" in result.stderr:
-                    console.print("  📱 Android licenses need acceptance")
-                    self._handle_android_licenses()
+            # Check for Android licenses
+            if licenses_needed:
+                console.print("  📱 Android licenses need acceptance")
+                self._handle_android_licenses()
 
         except Exception as e:
             console.print(f"  ⚠️  Flutter doctor warning: {e}")
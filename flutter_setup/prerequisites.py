@@ -1,12 +1,17 @@
 """Prerequisites management for Flutter setup."""
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 from rich.console import Console
 
-from .config import Config
+from .config import HOME, Config
 from .exceptions import PrerequisitesError
+from .probe_cache import ProbeCache
+from .process import run
 
 console = Console()
 
@@ -14,10 +19,15 @@ console = Console()
 class PrerequisitesManager:
     """Manages system prerequisites for Flutter development."""
 
+    home = HOME
+
     def __init__(self, config: Config):
         """Initialize PrerequisitesManager."""
         self.config = config
-        self.home = Path.home()
+        self._probes = ProbeCache()
+        if config.refresh:
+            self._probes.clear()
+        self._brew_lists: Dict[str, Set[str]] = {}
 
     def check_and_install(self) -> None:
         """Check and install all required prerequisites."""
@@ -27,11 +37,16 @@ class PrerequisitesManager:
             )
             return
 
+        # The read-only probes don't depend on each other, so run them together
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            xcode_probe = pool.submit(self._probe, ["xcode-select", "-p"])
+            brew_probe = pool.submit(self._probe, ["brew", "--version"])
+
         # Check Xcode Command Line Tools
-        self._check_xcode_tools()
+        self._check_xcode_tools(self._record_probe(xcode_probe.result()))
 
         # Check and install Homebrew
-        self._check_homebrew()
+        self._check_homebrew(self._record_probe(brew_probe.result()))
 
         # Install required packages
         self._install_packages()
@@ -39,19 +54,19 @@ class PrerequisitesManager:
         # Platform-specific setup
         self._setup_platform_tools()
 
-    def _check_xcode_tools(self) -> None:
-        """Check and install Xcode Command Line Tools."""
+    def _check_xcode_tools(self, probe_result: int) -> None:
+        """Check and install Xcode Command Line Tools.
+
+        probe_result is the exit code of `xcode-select -p`.
+        """
         console.print("  📱 Checking Xcode Command Line Tools...")
 
         try:
             # Check if xcode-select is available
-            result = subprocess.run(
-                ["xcode-select", "-p"], capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
+            if probe_result != 0:
                 console.print("  ⚠️  Xcode Command Line Tools not found, installing...")
-                subprocess.run(["xcode-select", "--install"], check=True)
+                # Leave stdin attached; the installer may prompt
+                run(["xcode-select", "--install"], stdin=None, check=True)
                 console.print("  ✅ Xcode Command Line Tools installation initiated")
                 console.print(
                     "  ℹ️  Please complete the installation in the popup window"
@@ -68,17 +83,16 @@ class PrerequisitesManager:
         except subprocess.CalledProcessError as e:
             raise PrerequisitesError(f"Failed to check Xcode tools: {e}")
 
-    def _check_homebrew(self) -> None:
-        """Check and install Homebrew."""
+    def _check_homebrew(self, probe_result: int) -> None:
+        """Check and install Homebrew.
+
+        probe_result is the exit code of `brew --version`.
+        """
         console.print("  🍺 Checking Homebrew...")
 
         try:
             # Check if brew is available
-            result = subprocess.run(
-                ["brew", "--version"], capture_output=True, text=True, check=False
-            )
-
-            if result.returncode != 0:
+            if probe_result != 0:
                 console.print("  ⚠️  Homebrew not found, installing...")
                 self._install_homebrew()
             else:
@@ -88,15 +102,42 @@ class PrerequisitesManager:
         except subprocess.CalledProcessError as e:
             raise PrerequisitesError(f"Failed to check Homebrew: {e}")
 
+    def _probe(self, argv: List[str]) -> Tuple[int, Optional[str]]:
+        """Run a read-only probe, reusing a recent success from the cache.
+
+        Returns the exit code, and the cache key to record if the probe ran
+        and succeeded. Probes run on worker threads, so recording is left to
+        _record_probe on the main thread.
+        """
+        key = ProbeCache.tool_key(*argv)
+        if key is not None and self._probes.get(key) == 0:
+            return 0, None
+
+        try:
+            result = run(argv, capture_output=True, check=False)
+        except FileNotFoundError:
+            # Same exit code a shell reports for a missing command
+            return 127, None
+
+        return result.returncode, key if result.returncode == 0 else None
+
+    def _record_probe(self, probe: Tuple[int, Optional[str]]) -> int:
+        """Cache a fresh probe success and return the probe's exit code."""
+        returncode, key = probe
+        if key is not None:
+            self._probes.set(key, 0)
+        return returncode
+
     def _install_homebrew(self) -> None:
         """Install Homebrew."""
         try:
             install_script = (
                 "https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh"
             )
-            subprocess.run(
+            run(
                 ["/bin/bash", "-c", f'curl -fsSL "{install_script}" | bash'],
-                env={"NONINTERACTIVE": "1"},
+                env={**os.environ, "NONINTERACTIVE": "1"},
+                stdin=None,  # May prompt for a sudo password
                 check=True,
             )
             console.print("  ✅ Homebrew installed")
@@ -110,7 +151,7 @@ class PrerequisitesManager:
         try:
             # Check for Apple Silicon Homebrew
             if Path("/opt/homebrew/bin/brew").exists():
-                subprocess.run(["/opt/homebrew/bin/brew", "shellenv"], check=True)
+                run(["/opt/homebrew/bin/brew", "shellenv"], check=True)
                 console.print("  ✅ Homebrew path configured")
         except subprocess.CalledProcessError:
             # This is not critical, just a warning
@@ -124,23 +165,54 @@ class PrerequisitesManager:
 
         for package in required_packages:
             console.print(f"  📦 Installing {package}...")
-            try:
-                subprocess.run(
-                    ["brew", "install", package], check=True, capture_output=True
-                )
+
+        missing = self._brew_missing(required_packages, "--formula")
+        installed = missing
+        try:
+            self._brew_install(missing)
+        except subprocess.CalledProcessError as e:
+            failed = self._brew_missing(missing, "--formula")
+            if failed:
+                raise PrerequisitesError(f"Failed to install {', '.join(failed)}: {e}")
+            # brew can exit non-zero with the keg in place, e.g. on a link
+            # conflict; the packages are there, so carry on
+            installed = []
+
+        for package in required_packages:
+            if package in installed:
                 console.print(f"  ✅ {package} installed")
-            except subprocess.CalledProcessError as e:
-                # Check if already installed
-                result = subprocess.run(
-                    ["brew", "list", package],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    console.print(f"  ✅ {package} already installed")
-                else:
-                    raise PrerequisitesError(f"Failed to install {package}: {e}")
+            else:
+                console.print(f"  ✅ {package} already installed")
+
+    def _brew_install(self, packages: List[str], cask: bool = False) -> None:
+        """Install packages with a single brew command.
+
+        Homebrew doesn't support concurrent installs, but one command can
+        install several packages.
+        """
+        if not packages:
+            return
+
+        # Listings taken before this install are out of date now
+        self._brew_lists.clear()
+        run(
+            ["brew", "install", *(["--cask"] if cask else []), *packages],
+            check=True,
+            capture_output=True,
+        )
+
+    def _brew_missing(self, packages: List[str], kind: str) -> List[str]:
+        """Get the packages that aren't installed as formulae or casks."""
+        return [p for p in packages if p not in self._brew_list(kind)]
+
+    def _brew_list(self, kind: str) -> Set[str]:
+        """Get installed formulae or casks, listing each kind only once."""
+        if kind not in self._brew_lists:
+            result = run(
+                ["brew", "list", kind], capture_output=True, text=True, check=False
+            )
+            self._brew_lists[kind] = set(result.stdout.split())
+        return self._brew_lists[kind]
 
     def _setup_platform_tools(self) -> None:
         """Setup platform-specific development tools."""
@@ -156,30 +228,24 @@ class PrerequisitesManager:
         """Setup Android development tools."""
         console.print("  🤖 Setting up Android development tools...")
 
-        android_packages = [
-            ("--cask", "temurin"),
-            ("--cask", "android-commandlinetools"),
-        ]
+        android_packages = ["temurin", "android-commandlinetools"]
 
-        for args in android_packages:
-            package = args[1]
-            try:
-                subprocess.run(
-                    ["brew", "install"] + list(args), check=True, capture_output=True
-                )
+        missing = self._brew_missing(android_packages, "--cask")
+        installed = missing
+        failed: List[str] = []
+        try:
+            self._brew_install(missing, cask=True)
+        except subprocess.CalledProcessError as e:
+            failed = self._brew_missing(missing, "--cask")
+            for package in failed:
+                console.print(f"  ⚠️  Failed to install {package}: {e}")
+            installed = []
+
+        for package in android_packages:
+            if package in installed:
                 console.print(f"  ✅ {package} installed")
-            except subprocess.CalledProcessError as e:
-                # Check if already installed
-                result = subprocess.run(
-                    ["brew", "list", "--cask", package],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    console.print(f"  ✅ {package} already installed")
-                else:
-                    console.print(f"  ⚠️  Failed to install {package}: {e}")
+            elif package not in failed:
+                console.print(f"  ✅ {package} already installed")
 
     def _setup_ios_tools(self) -> None:
         """Setup iOS development tools."""
@@ -187,7 +253,7 @@ class PrerequisitesManager:
 
         try:
             # Update CocoaPods repository
-            subprocess.run(
+            run(
                 ["pod", "repo", "update"],
                 check=False,  # Not critical if it fails
                 capture_output=True,
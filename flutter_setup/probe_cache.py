@@ -0,0 +1,104 @@
+"""Persistent cache of tool probe results for Flutter setup."""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import HOME
+
+CACHE_FILE = HOME / ".cache" / "flutter-setup" / "probes.json"
+PROBE_TTL_SECONDS = 24 * 60 * 60
+
+
+class ProbeCache:
+    """Remembers successful tool probes between runs."""
+
+    def __init__(self, path: Path = CACHE_FILE):
+        """Initialize ProbeCache."""
+        self.path = path
+        self._entries = self._load()
+
+    @staticmethod
+    def tool_key(tool: str, *extra: str) -> Optional[str]:
+        """Build a cache key that changes whenever the tool binary changes.
+
+        Returns None if the tool is not on PATH, so nothing gets cached.
+        """
+        path = shutil.which(tool)
+        if path is None:
+            return None
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+
+        return "|".join([tool, path, str(mtime), *extra])
+
+    def get(self, key: str, ttl_seconds: float = PROBE_TTL_SECONDS) -> Any:
+        """Get a cached value, or None if missing or older than the TTL."""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry["time"] > ttl_seconds:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value and persist it."""
+        # Re-read first so entries written by other managers aren't lost
+        now = time.time()
+        entries = {
+            k: v
+            for k, v in self._load().items()
+            if now - v["time"] <= PROBE_TTL_SECONDS
+        }
+        entries[key] = {"time": now, "value": value}
+        self._entries = entries
+        self._save()
+
+    def clear(self) -> None:
+        """Drop all cached probes."""
+        self._entries = {}
+        self._save()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load cached entries, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+
+        return {
+            key: entry
+            for key, entry in entries.items()
+            if isinstance(entry, dict) and "time" in entry and "value" in entry
+        }
+
+    def _save(self) -> None:
+        """Write cached entries; caching is best effort.
+
+        The entries go to a temporary file that replaces the cache, so
+        readers never see a partly written file.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,25 @@
+"""Subprocess helpers for Flutter setup."""
+
+import functools
+import shutil
+import subprocess
+from typing import Any, Sequence
+
+
+@functools.lru_cache(maxsize=None)
+def tool(name: str) -> str:
+    """Resolve a command to its absolute path once per run.
+
+    Unknown commands are returned unchanged so exec still reports them.
+    """
+    return shutil.which(name) or name
+
+
+def run(argv: Sequence[str], **kwargs: Any) -> "subprocess.CompletedProcess[Any]":
+    """Run a command with its executable resolved through tool().
+
+    Stdin is detached unless the caller passes its own, so commands can't
+    block waiting on the terminal.
+    """
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+    return subprocess.run([tool(argv[0]), *argv[1:]], **kwargs)
@@ -1,13 +1,13 @@
 """Project creation for Flutter setup."""
 
 import subprocess
-from pathlib import Path
 from typing import List
 
 from rich.console import Console
 
-from .config import Config
+from .config import FLUTTER_ROOT, HOME, Config
 from .exceptions import ProjectCreationError
+from .process import run
 
 console = Console()
 
@@ -15,11 +15,12 @@ console = Console()
 class ProjectCreator:
     """Creates Flutter projects with specified configuration."""
 
+    home = HOME
+    flutter_root = FLUTTER_ROOT
+
     def __init__(self, config: Config):
         """Initialize ProjectCreator."""
         self.config = config
-        self.home = Path.home()
-        self.flutter_root = self.home / "development" / "flutter"
 
     def create_project(self) -> None:
         """Create the Flutter project."""
@@ -44,7 +45,7 @@ class ProjectCreator:
         console.print(f"  🏗️  Creating Flutter project at {self.config.project_path}...")
 
         try:
-            subprocess.run(create_cmd, check=True, capture_output=True, text=True)
+            run(create_cmd, check=True, capture_output=True)
             console.print(f"  ✅ Project created at: {self.config.project_path}")
 
         except subprocess.CalledProcessError as e:
@@ -0,0 +1,98 @@
+"""Tests for the bootstrap module."""
+
+from pathlib import Path
+
+from flutter_setup.bootstrap import ProjectBootstrap
+from flutter_setup.config import Config
+
+DOTENV_IMPORT = "import 'package:flutter_dotenv/flutter_dotenv.dart';"
+
+
+def make_bootstrap(tmp_path: Path, main_dart: str = "") -> ProjectBootstrap:
+    """Create a bootstrap for a project in tmp_path with the given main.dart."""
+    config = Config(
+        project_name="My App",
+        platforms=["ios"],
+        org="com.test",
+        channel="stable",
+        output_dir=tmp_path,
+        template="app",
+        ios_language="swift",
+        android_language="kotlin",
+        flutter_update_mode="reset",
+        dry_run=False,
+        verbose=False,
+    )
+    lib = config.project_path / "lib"
+    lib.mkdir(parents=True)
+    (lib / "main.dart").write_text(main_dart)
+    return ProjectBootstrap(config)
+
+
+def read_main_dart(bootstrap: ProjectBootstrap) -> str:
+    """Read the bootstrap project's main.dart."""
+    return (bootstrap.config.project_path / "lib" / "main.dart").read_text()
+
+
+class TestProjectBootstrap:
+    """Test cases for ProjectBootstrap class."""
+
+    def test_import_after_flutter_import(self, tmp_path: Path) -> None:
+        """Test the dotenv import goes after the first flutter import."""
+        bootstrap = make_bootstrap(
+            tmp_path,
+            "import 'dart:async';\n"
+            "import 'package:flutter/material.dart';\n"
+            "import 'package:flutter/services.dart';\n"
+            "\n"
+            "void main() {\n"
+            "  runApp(const MyApp());\n"
+            "}\n",
+        )
+        bootstrap._modify_main_dart()
+
+        assert read_main_dart(bootstrap) == (
+            "import 'dart:async';\n"
+            "import 'package:flutter/material.dart';\n"
+            f"{DOTENV_IMPORT}\n"
+            "import 'package:flutter/services.dart';\n"
+            "\n"
+            "Future<void> main() async {\n"
+            '  await dotenv.load(fileName: ".env");\n'
+            "  runApp(const MyApp());\n"
+            "}\n"
+        )
+
+    def test_import_prepended(self, tmp_path: Path) -> None:
+        """Test the dotenv import is prepended without a flutter import."""
+        bootstrap = make_bootstrap(tmp_path, "void main() {}\n")
+        bootstrap._modify_main_dart()
+
+        assert read_main_dart(bootstrap).startswith(f"{DOTENV_IMPORT}\n")
+
+    def test_spaced_main_patched(self, tmp_path: Path) -> None:
+        """Test main is patched when written with extra whitespace."""
+        bootstrap = make_bootstrap(tmp_path, "void main ( ) {\n}\n")
+        bootstrap._modify_main_dart()
+
+        assert "Future<void> main() async {\n" in read_main_dart(bootstrap)
+        assert "void main (" not in read_main_dart(bootstrap)
+
+    def test_already_patched(self, tmp_path: Path) -> None:
+        """Test main.dart is left alone if it already uses flutter_dotenv."""
+        content = f"{DOTENV_IMPORT}\n\nvoid main() {{}}\n"
+        bootstrap = make_bootstrap(tmp_path, content)
+        bootstrap._modify_main_dart()
+
+        assert read_main_dart(bootstrap) == content
+
+    def test_write_templates(self, tmp_path: Path) -> None:
+        """Test rendered files contain the package and project names."""
+        bootstrap = make_bootstrap(tmp_path)
+        bootstrap._write_templates()
+
+        root = bootstrap.config.project_path
+        widget_test = root / "test" / "widget" / "app_widget_test.dart"
+        assert "import 'package:my_app/main.dart';" in widget_test.read_text()
+        assert (root / "README.md").read_text().startswith("# My App\n")
+        assert (root / "Makefile").is_file()
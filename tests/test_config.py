@@ -54,6 +54,24 @@ class TestConfig:
 
         assert config.package_name == "my_test_app"
 
+    def test_package_name_collapses_separators(self) -> None:
+        """Test runs of invalid characters become a single underscore."""
+        config = Config(
+            project_name="My -- Test   App",
+            platforms=["ios"],
+            org="com.test",
+            channel="stable",
+            output_dir=Path("."),
+            template="app",
+            ios_language="swift",
+            android_language="kotlin",
+            flutter_update_mode="reset",
+            dry_run=False,
+            verbose=False,
+        )
+
+        assert config.package_name == "my_test_app"
+
     def test_platforms_csv(self) -> None:
         """Test platforms CSV generation."""
         config = Config(
@@ -72,6 +90,25 @@ class TestConfig:
 
         assert config.platforms_csv == "ios,android,web"
 
+    def test_platforms_normalized(self) -> None:
+        """Test platforms are lowercased and deduplicated in order."""
+        config = Config(
+            project_name="TestApp",
+            platforms=["iOS", "Android", "ios"],
+            org="com.test",
+            channel="stable",
+            output_dir=Path("."),
+            template="app",
+            ios_language="swift",
+            android_language="kotlin",
+            flutter_update_mode="reset",
+            dry_run=False,
+            verbose=False,
+        )
+
+        assert config.platforms == ["ios", "android"]
+        assert config.platforms_csv == "ios,android"
+
     def test_project_path(self) -> None:
         """Test project path generation."""
         config = Config(
@@ -89,6 +126,7 @@ class TestConfig:
         )
 
         assert config.project_path == Path("/tmp/TestApp")
+        assert config.project_path_str == "/tmp/TestApp"
 
     def test_invalid_project_name(self) -> None:
         """Test validation of empty project name."""
@@ -140,3 +178,37 @@ class TestConfig:
                 dry_run=False,
                 verbose=False,
             )
+
+    def test_invalid_channel(self) -> None:
+        """Test validation of an unknown Flutter channel."""
+        with pytest.raises(ValueError, match="Invalid channel: master"):
+            Config(
+                project_name="TestApp",
+                platforms=["ios"],
+                org="com.test",
+                channel="master",  # type: ignore[arg-type]
+                output_dir=Path("."),
+                template="app",
+                ios_language="swift",
+                android_language="kotlin",
+                flutter_update_mode="reset",
+                dry_run=False,
+                verbose=False,
+            )
+
+    def test_invalid_plugin_language(self) -> None:
+        """Test validation of plugin languages."""
+        with pytest.raises(ValueError, match="Invalid Android language: scala"):
+            Config(
+                project_name="TestApp",
+                platforms=["android"],
+                org="com.test",
+                channel="stable",
+                output_dir=Path("."),
+                template="plugin",
+                ios_language="swift",
+                android_language="scala",  # type: ignore[arg-type]
+                flutter_update_mode="reset",
+                dry_run=False,
+                verbose=False,
+            )
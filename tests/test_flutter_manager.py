@@ -0,0 +1,73 @@
+"""Tests for the Flutter manager module."""
+
+import hashlib
+import tarfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pytest
+
+from flutter_setup.config import Config
+from flutter_setup.flutter_manager import FlutterManager
+
+
+def make_manager(tmp_path: Path) -> FlutterManager:
+    """Create a FlutterManager that installs under tmp_path."""
+    config = Config(
+        project_name="TestApp",
+        platforms=["ios"],
+        org="com.test",
+        channel="stable",
+        output_dir=Path("."),
+        template="app",
+        ios_language="swift",
+        android_language="kotlin",
+        flutter_update_mode="reset",
+        dry_run=False,
+        verbose=False,
+    )
+    manager = FlutterManager(config)
+    manager.flutter_root = tmp_path / "development" / "flutter"
+    manager.flutter_root.parent.mkdir()
+    return manager
+
+
+def make_archive(tmp_path: Path) -> Tuple[str, str]:
+    """Build a release-style archive, returning its URL and SHA-256."""
+    sdk = tmp_path / "sdk" / "flutter" / "bin"
+    sdk.mkdir(parents=True)
+    (sdk / "flutter").write_text("#!/bin/sh\n")
+
+    archive = tmp_path / "flutter_linux_3.0.0-stable.tar.xz"
+    with tarfile.open(archive, "w:xz") as tar:
+        tar.add(tmp_path / "sdk" / "flutter", arcname="flutter")
+
+    return archive.as_uri(), hashlib.sha256(archive.read_bytes()).hexdigest()
+
+
+class TestDownloadSdkArchive:
+    """Test cases for FlutterManager._download_sdk_archive."""
+
+    def test_archive_installed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a verified archive is extracted into the Flutter root."""
+        manager = make_manager(tmp_path)
+        found: Optional[Tuple[str, str]] = make_archive(tmp_path)
+        monkeypatch.setattr(manager, "_find_sdk_archive", lambda channel: found)
+
+        assert manager._download_sdk_archive("stable") is True
+        assert (manager.flutter_root / "bin" / "flutter").is_file()
+        assert list(manager.flutter_root.parent.iterdir()) == [manager.flutter_root]
+
+    def test_checksum_mismatch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an archive with the wrong checksum is never extracted."""
+        manager = make_manager(tmp_path)
+        url, _ = make_archive(tmp_path)
+        found: Optional[Tuple[str, str]] = (url, "0" * 64)
+        monkeypatch.setattr(manager, "_find_sdk_archive", lambda channel: found)
+
+        assert manager._download_sdk_archive("stable") is False
+        assert list(manager.flutter_root.parent.iterdir()) == []
@@ -0,0 +1,94 @@
+"""Tests for the prerequisites module."""
+
+import subprocess
+from pathlib import Path
+from typing import Any, List, Set
+
+import pytest
+
+from flutter_setup import prerequisites
+from flutter_setup.config import Config
+from flutter_setup.exceptions import PrerequisitesError
+from flutter_setup.prerequisites import PrerequisitesManager
+
+
+class FakeBrew:
+    """Stands in for brew, tracking installed formulae."""
+
+    def __init__(self, installed: Set[str], exit_code: int, installs: bool):
+        """Initialize FakeBrew."""
+        self.installed = installed
+        self.exit_code = exit_code
+        self.installs = installs
+        self.calls: List[List[str]] = []
+
+    def run(self, argv: List[str], **kwargs: Any) -> "subprocess.CompletedProcess[Any]":
+        """Handle `brew list --formula` and `brew install`."""
+        self.calls.append(argv)
+        if argv[1] == "list":
+            return subprocess.CompletedProcess(argv, 0, "\n".join(self.installed))
+
+        if self.installs:
+            self.installed.update(argv[2:])
+        if self.exit_code != 0:
+            raise subprocess.CalledProcessError(self.exit_code, argv)
+        return subprocess.CompletedProcess(argv, 0)
+
+
+def make_manager() -> PrerequisitesManager:
+    """Create a PrerequisitesManager for an iOS project."""
+    config = Config(
+        project_name="TestApp",
+        platforms=["ios"],
+        org="com.test",
+        channel="stable",
+        output_dir=Path("."),
+        template="app",
+        ios_language="swift",
+        android_language="kotlin",
+        flutter_update_mode="reset",
+        dry_run=False,
+        verbose=False,
+    )
+    return PrerequisitesManager(config)
+
+
+class TestInstallPackages:
+    """Test cases for PrerequisitesManager._install_packages."""
+
+    def test_install_succeeds(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test only missing packages are installed, in one brew command."""
+        brew = FakeBrew({"git"}, exit_code=0, installs=True)
+        monkeypatch.setattr(prerequisites, "run", brew.run)
+
+        make_manager()._install_packages()
+
+        assert ["brew", "install", "cocoapods"] in brew.calls
+        out = capsys.readouterr().out
+        assert "git already installed" in out
+        assert "cocoapods installed" in out
+
+    def test_install_fails_but_package_present(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a failed install is ignored if the package ends up installed."""
+        brew = FakeBrew(set(), exit_code=1, installs=True)
+        monkeypatch.setattr(prerequisites, "run", brew.run)
+
+        make_manager()._install_packages()
+
+        out = capsys.readouterr().out
+        assert "git already installed" in out
+        assert "cocoapods already installed" in out
+
+    def test_install_fails_and_package_missing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed install raises, naming the missing packages."""
+        brew = FakeBrew({"git"}, exit_code=1, installs=False)
+        monkeypatch.setattr(prerequisites, "run", brew.run)
+
+        with pytest.raises(PrerequisitesError, match="Failed to install cocoapods:"):
+            make_manager()._install_packages()
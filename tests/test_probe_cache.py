@@ -0,0 +1,71 @@
+"""Tests for the probe cache module."""
+
+import json
+import time
+from pathlib import Path
+
+from flutter_setup.probe_cache import ProbeCache
+
+
+class TestProbeCache:
+    """Test cases for ProbeCache class."""
+
+    def test_set_and_get(self, tmp_path: Path) -> None:
+        """Test a cached value is returned and persisted."""
+        cache_file = tmp_path / "probes.json"
+        cache = ProbeCache(cache_file)
+        cache.set("brew", 0)
+
+        assert cache.get("brew") == 0
+        assert ProbeCache(cache_file).get("brew") == 0
+
+    def test_expired_entry(self, tmp_path: Path) -> None:
+        """Test entries older than the TTL are ignored."""
+        cache_file = tmp_path / "probes.json"
+        cache_file.write_text(
+            json.dumps({"brew": {"time": time.time() - 120, "value": 0}})
+        )
+
+        assert ProbeCache(cache_file).get("brew", ttl_seconds=60) is None
+
+    def test_set_keeps_entries_from_other_instances(self, tmp_path: Path) -> None:
+        """Test concurrent instances don't overwrite each other's entries."""
+        cache_file = tmp_path / "probes.json"
+        first = ProbeCache(cache_file)
+        second = ProbeCache(cache_file)
+        first.set("xcode-select", 0)
+        second.set("git", 0)
+
+        reloaded = ProbeCache(cache_file)
+        assert reloaded.get("xcode-select") == 0
+        assert reloaded.get("git") == 0
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clearing drops persisted entries."""
+        cache_file = tmp_path / "probes.json"
+        cache = ProbeCache(cache_file)
+        cache.set("brew", 0)
+        cache.clear()
+
+        assert ProbeCache(cache_file).get("brew") is None
+
+    def test_corrupt_file(self, tmp_path: Path) -> None:
+        """Test a corrupt cache file is treated as empty."""
+        cache_file = tmp_path / "probes.json"
+        cache_file.write_text("not json")
+
+        assert ProbeCache(cache_file).get("brew") is None
+
+    def test_tool_key_missing_tool(self) -> None:
+        """Test no key is built for tools that aren't installed."""
+        assert ProbeCache.tool_key("definitely-not-a-real-tool") is None
+
+    def test_save_replaces_file(self, tmp_path: Path) -> None:
+        """Test saving leaves only the cache file behind."""
+        cache_file = tmp_path / "probes.json"
+        cache = ProbeCache(cache_file)
+        cache.set("brew", 0)
+        cache.set("git", 0)
+
+        assert list(tmp_path.iterdir()) == [cache_file]
+        assert json.loads(cache_file.read_text()).keys() == {"brew", "git"}
@@ -0,0 +1,29 @@
+"""Tests for the process helpers module."""
+
+import shutil
+import sys
+
+from flutter_setup.process import run, tool
+
+
+class TestProcess:
+    """Test cases for tool and run helpers."""
+
+    def test_tool_resolves_path(self) -> None:
+        """Test known commands resolve to their absolute path."""
+        assert tool("sh") == shutil.which("sh")
+
+    def test_tool_unknown_command(self) -> None:
+        """Test unknown commands are returned unchanged."""
+        assert tool("definitely-not-a-real-tool") == "definitely-not-a-real-tool"
+
+    def test_run_detaches_stdin(self) -> None:
+        """Test commands read EOF from stdin by default."""
+        result = run(
+            [sys.executable, "-c", "import sys; print(repr(sys.stdin.read()))"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "''"